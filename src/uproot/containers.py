@@ -785,10 +785,11 @@ class AsVector(AsContainer):
         else:
             is_memberwise = False
 
-        # Note: self._values can also be a NumPy dtype, and not necessarily a class
-        # (e.g. type(self._values) == type)
-        _value_typename = _content_typename(self._values)
         if is_memberwise:
+            # Note: self._values can also be a NumPy dtype, and not necessarily a class
+            # (e.g. type(self._values) == type)
+            _value_typename = _content_typename(self._values)
+
             # let's hard-code in logic for std::pair<T1,T2> for now
             if not _value_typename.startswith("pair"):
                 raise NotImplementedError(
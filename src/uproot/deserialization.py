@@ -25,9 +25,17 @@ scope = {
 
 np_uint8 = numpy.dtype("u1")
 
+_compiled_class_code = {}
+
 
 def _actually_compile(class_code, new_scope):
-    exec(compile(class_code, "<dynamic>", "exec"), new_scope)
+    # the same class code is generated for every file that shares a streamer,
+    # so it is parsed and compiled only once per process
+    code = _compiled_class_code.get(class_code)
+    if code is None:
+        code = compile(class_code, "<dynamic>", "exec")
+        _compiled_class_code[class_code] = code
+    exec(code, new_scope)
 
 
 def _yield_all_behaviors(cls, c):
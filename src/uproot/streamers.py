@@ -15,113 +15,178 @@ import numpy
 
 import uproot
 
-_canonical_typename_patterns = [
-    (re.compile(r"\bChar_t\b"), "char"),
-    (re.compile(r"\bUChar_t\b"), "unsigned char"),
-    (re.compile(r"\bShort_t\b"), "short"),
-    (re.compile(r"\bUShort_t\b"), "unsigned short"),
-    (re.compile(r"\bInt_t\b"), "int"),
-    (re.compile(r"\bUInt_t\b"), "unsigned int"),
-    (re.compile(r"\bSeek_t\b"), "int"),  # file pointer
-    (re.compile(r"\bLong_t\b"), "long"),
-    (re.compile(r"\bULong_t\b"), "unsigned long"),
-    (re.compile(r"\bFloat_t\b"), "float"),
-    (
-        re.compile(r"\bFloat16_t\b"),
-        "Float16_t",
-    ),  # 32-bit, written as 16, trunc mantissa
-    (re.compile(r"\bDouble_t\b"), "double"),
-    (re.compile(r"\bDouble32_t\b"), "Double32_t"),  # 64-bit, written as 32
-    (re.compile(r"\bLongDouble_t\b"), "long double"),
-    (re.compile(r"\bText_t\b"), "char"),
-    (re.compile(r"\bBool_t\b"), "bool"),
-    (re.compile(r"\bByte_t\b"), "unsigned char"),
-    (re.compile(r"\bVersion_t\b"), "short"),  # class version id
-    (re.compile(r"\bOption_t\b"), "const char"),  # option string
-    (re.compile(r"\bSsiz_t\b"), "int"),  # string size
-    (re.compile(r"\bReal_t\b"), "float"),  # TVector/TMatrix element
-    (re.compile(r"\bLong64_t\b"), "long long"),  # portable int64
-    (re.compile(r"\bULong64_t\b"), "unsigned long long"),  # portable uint64
-    (re.compile(r"\bAxis_t\b"), "double"),  # axis values type
-    (re.compile(r"\bStat_t\b"), "double"),  # statistics type
-    (re.compile(r"\bFont_t\b"), "short"),  # font number
-    (re.compile(r"\bStyle_t\b"), "short"),  # style number
-    (re.compile(r"\bMarker_t\b"), "short"),  # marker number
-    (re.compile(r"\bWidth_t\b"), "short"),  # line width
-    (re.compile(r"\bColor_t\b"), "short"),  # color number
-    (re.compile(r"\bSCoord_t\b"), "short"),  # screen coordinates
-    (re.compile(r"\bCoord_t\b"), "double"),  # pad world coordinates
-    (re.compile(r"\bAngle_t\b"), "float"),  # graphics angle
-    (re.compile(r"\bSize_t\b"), "float"),  # attribute size
-]
+_kObjectp = uproot.const.kObjectp
+_kAnyp = uproot.const.kAnyp
+_kObjectP = uproot.const.kObjectP
+_kAnyP = uproot.const.kAnyP
+_kSTLmultimap = uproot.const.kSTLmultimap
+_kSTLset = uproot.const.kSTLset
+_kOffsetL = uproot.const.kOffsetL
+_kOffsetP = uproot.const.kOffsetP
+_kChar = uproot.const.kChar
+_kShort = uproot.const.kShort
+_kInt = uproot.const.kInt
+_kCounter = uproot.const.kCounter
+_kLong = uproot.const.kLong
+_kFloat = uproot.const.kFloat
+_kCharStar = uproot.const.kCharStar
+_kDouble = uproot.const.kDouble
+_kDouble32 = uproot.const.kDouble32
+_kUChar = uproot.const.kUChar
+_kUShort = uproot.const.kUShort
+_kUInt = uproot.const.kUInt
+_kULong = uproot.const.kULong
+_kBits = uproot.const.kBits
+_kLong64 = uproot.const.kLong64
+_kULong64 = uproot.const.kULong64
+_kBool = uproot.const.kBool
+_kFloat16 = uproot.const.kFloat16
+
+_canonical_typename_replacements = {
+    "Char_t": "char",
+    "UChar_t": "unsigned char",
+    "Short_t": "short",
+    "UShort_t": "unsigned short",
+    "Int_t": "int",
+    "UInt_t": "unsigned int",
+    "Seek_t": "int",  # file pointer
+    "Long_t": "long",
+    "ULong_t": "unsigned long",
+    "Float_t": "float",
+    "Float16_t": "Float16_t",  # 32-bit, written as 16, trunc mantissa
+    "Double_t": "double",
+    "Double32_t": "Double32_t",  # 64-bit, written as 32
+    "LongDouble_t": "long double",
+    "Text_t": "char",
+    "Bool_t": "bool",
+    "Byte_t": "unsigned char",
+    "Version_t": "short",  # class version id
+    "Option_t": "const char",  # option string
+    "Ssiz_t": "int",  # string size
+    "Real_t": "float",  # TVector/TMatrix element
+    "Long64_t": "long long",  # portable int64
+    "ULong64_t": "unsigned long long",  # portable uint64
+    "Axis_t": "double",  # axis values type
+    "Stat_t": "double",  # statistics type
+    "Font_t": "short",  # font number
+    "Style_t": "short",  # style number
+    "Marker_t": "short",  # marker number
+    "Width_t": "short",  # line width
+    "Color_t": "short",  # color number
+    "SCoord_t": "short",  # screen coordinates
+    "Coord_t": "double",  # pad world coordinates
+    "Angle_t": "float",  # graphics angle
+    "Size_t": "float",  # attribute size
+}
+
+_canonical_typename_pattern = re.compile(
+    r"\b("
+    + "|".join(sorted(_canonical_typename_replacements, key=lambda x: (-len(x), x)))
+    + r")\b"
+)
+
+
+def _canonical_typename_replace(match):
+    return _canonical_typename_replacements[match.group(1)]
+
+
+_canonical_typename_cache = {}
+
+if uproot._util.py2:
+    _intern = intern  # noqa: F821
+else:
+    _intern = sys.intern
 
 
 def _canonical_typename(name):
-    for pattern, replacement in _canonical_typename_patterns:
-        name = pattern.sub(replacement, name)
-    return name
+    out = _canonical_typename_cache.get(name)
+    if out is None:
+        # every ROOT typedef ends in "_t", so most names need no regex pass
+        if "_t" in name:
+            out = _canonical_typename_pattern.sub(_canonical_typename_replace, name)
+        else:
+            out = name
+        # typenames are used as dict keys downstream; interning makes
+        # equal names from different streamers the same object
+        out = _intern(out)
+        _canonical_typename_cache[name] = out
+    return out
+
+
+_ftype_dtypes = {
+    _kBool: "numpy.dtype(numpy.bool_)",
+    _kChar: "numpy.dtype('i1')",
+    _kUChar: "numpy.dtype('u1')",
+    _kCharStar: "numpy.dtype('u1')",
+    _kShort: "numpy.dtype('>i2')",
+    _kUShort: "numpy.dtype('>u2')",
+    _kInt: "numpy.dtype('>i4')",
+    _kBits: "numpy.dtype('>u4')",
+    _kUInt: "numpy.dtype('>u4')",
+    _kCounter: "numpy.dtype('>u4')",
+    _kLong: "numpy.dtype('>i8')",
+    _kULong: "numpy.dtype('>u8')",
+    _kLong64: "numpy.dtype('>i8')",
+    _kULong64: "numpy.dtype('>u8')",
+    _kFloat: "numpy.dtype('>f4')",
+    _kFloat16: "numpy.dtype('>f4')",
+    _kDouble: "numpy.dtype('>f8')",
+    _kDouble32: "numpy.dtype('>f8')",
+}
+
+_ftype_structs = {
+    _kBool: "?",
+    _kChar: "b",
+    _kUChar: "B",
+    _kCharStar: "B",
+    _kShort: "h",
+    _kUShort: "H",
+    _kInt: "i",
+    _kBits: "I",
+    _kUInt: "I",
+    _kCounter: "I",
+    _kLong: "q",
+    _kULong: "Q",
+    _kLong64: "q",
+    _kULong64: "Q",
+    _kFloat: "f",
+    _kFloat16: "f",
+    _kDouble: "d",
+    _kDouble32: "d",
+}
+
+
+_ftype_sizes = {
+    _kBool: 1,
+    _kUChar: 1,
+    _kChar: 1,
+    _kUShort: 2,
+    _kShort: 2,
+    _kBits: 4,
+    _kUInt: 4,
+    _kInt: 4,
+    _kCounter: 4,
+    _kULong: numpy.dtype(numpy.compat.long).itemsize,
+    _kLong: numpy.dtype(numpy.compat.long).itemsize,
+    _kULong64: 8,
+    _kLong64: 8,
+    _kFloat: 4,
+    _kFloat16: 4,
+    _kDouble: 8,
+    _kDouble32: 8,
+    _kCharStar: numpy.dtype(numpy.intp).itemsize,
+}
 
 
 def _ftype_to_dtype(fType):
-    if fType == uproot.const.kBool:
-        return "numpy.dtype(numpy.bool_)"
-    elif fType == uproot.const.kChar:
-        return "numpy.dtype('i1')"
-    elif fType in (uproot.const.kUChar, uproot.const.kCharStar):
-        return "numpy.dtype('u1')"
-    elif fType == uproot.const.kShort:
-        return "numpy.dtype('>i2')"
-    elif fType == uproot.const.kUShort:
-        return "numpy.dtype('>u2')"
-    elif fType == uproot.const.kInt:
-        return "numpy.dtype('>i4')"
-    elif fType in (uproot.const.kBits, uproot.const.kUInt, uproot.const.kCounter):
-        return "numpy.dtype('>u4')"
-    elif fType == uproot.const.kLong:
-        return "numpy.dtype('>i8')"
-    elif fType == uproot.const.kULong:
-        return "numpy.dtype('>u8')"
-    elif fType == uproot.const.kLong64:
-        return "numpy.dtype('>i8')"
-    elif fType == uproot.const.kULong64:
-        return "numpy.dtype('>u8')"
-    elif fType in (uproot.const.kFloat, uproot.const.kFloat16):
-        return "numpy.dtype('>f4')"
-    elif fType in (uproot.const.kDouble, uproot.const.kDouble32):
-        return "numpy.dtype('>f8')"
-    else:
-        return None
+    return _ftype_dtypes.get(fType)
 
 
 def _ftype_to_struct(fType):
-    if fType == uproot.const.kBool:
-        return "?"
-    elif fType == uproot.const.kChar:
-        return "b"
-    elif fType in (uproot.const.kUChar, uproot.const.kCharStar):
-        return "B"
-    elif fType == uproot.const.kShort:
-        return "h"
-    elif fType == uproot.const.kUShort:
-        return "H"
-    elif fType == uproot.const.kInt:
-        return "i"
-    elif fType in (uproot.const.kBits, uproot.const.kUInt, uproot.const.kCounter):
-        return "I"
-    elif fType == uproot.const.kLong:
-        return "q"
-    elif fType == uproot.const.kULong:
-        return "Q"
-    elif fType == uproot.const.kLong64:
-        return "q"
-    elif fType == uproot.const.kULong64:
-        return "Q"
-    elif fType in (uproot.const.kFloat, uproot.const.kFloat16):
-        return "f"
-    elif fType in (uproot.const.kDouble, uproot.const.kDouble32):
-        return "d"
-    else:
+    out = _ftype_structs.get(fType)
+    if out is None:
         raise NotImplementedError(fType)
+    return out
 
 
 def _copy_bytes(chunk, start, stop, cursor, context):
@@ -266,11 +331,12 @@ class Model_TStreamerInfo(uproot.model.Model):
         member_names = []
         class_flags = {}
 
-        for i in uproot._util.range(len(self._members["fElements"])):
-            self._members["fElements"][i].class_code(
+        elements = self._members["fElements"]
+        for i, element in enumerate(elements):
+            element.class_code(
                 self,
                 i,
-                self._members["fElements"],
+                elements,
                 read_members,
                 read_member_n,
                 strided_interpretation,
@@ -346,14 +412,13 @@ class Model_TStreamerInfo(uproot.model.Model):
         )
 
         class_name = uproot.model.classname_encode(self.name, self.class_version)
-        return "\n".join(
-            ["class {0}(uproot.model.VersionedModel):".format(class_name)]
-            + read_members
-            + read_member_n
-            + strided_interpretation
-            + awkward_form
-            + class_data
-        )
+        out = ["class {0}(uproot.model.VersionedModel):".format(class_name)]
+        out.extend(read_members)
+        out.extend(read_member_n)
+        out.extend(strided_interpretation)
+        out.extend(awkward_form)
+        out.extend(class_data)
+        return "\n".join(out)
 
     def new_class(self, file):
         """
@@ -460,6 +525,7 @@ _tstreamerelement_format1 = struct.Struct(">iiii")
 _tstreamerelement_format2 = struct.Struct(">i")
 _tstreamerelement_format3 = struct.Struct(">ddd")
 _tstreamerelement_dtype1 = numpy.dtype(">i4")
+_tstreamerelement_bool_typenames = frozenset(["Bool_t", "bool"])
 
 
 class Model_TStreamerElement(uproot.model.Model):
@@ -471,6 +537,10 @@ class Model_TStreamerElement(uproot.model.Model):
     instead of creating a behavior class to mix in functionality.
     """
 
+    _cached_name_repr = None
+    _cached_typename_stripped = None
+    _cached_typename_stripped_repr = None
+
     def show(self, stream=sys.stdout):
         """
         Args:
@@ -530,6 +600,24 @@ class Model_TStreamerElement(uproot.model.Model):
         """
         return self.member("fType")
 
+    @property
+    def _name_repr(self):
+        if self._cached_name_repr is None:
+            self._cached_name_repr = repr(self.name)
+        return self._cached_name_repr
+
+    @property
+    def _typename_stripped(self):
+        if self._cached_typename_stripped is None:
+            self._cached_typename_stripped = self.typename.rstrip("*")
+        return self._cached_typename_stripped
+
+    @property
+    def _typename_stripped_repr(self):
+        if self._cached_typename_stripped_repr is None:
+            self._cached_typename_stripped_repr = repr(self._typename_stripped)
+        return self._cached_typename_stripped_repr
+
     def read_members(self, chunk, cursor, context, file):
         # https://github.com/root-project/root/blob/master/core/meta/src/TStreamerElement.cxx#L505
         self._bases.append(
@@ -563,8 +651,9 @@ class Model_TStreamerElement(uproot.model.Model):
 
         self._members["fTypeName"] = _canonical_typename(cursor.string(chunk, context))
 
-        if self._members["fType"] == 11 and self._members["fTypeName"] in (
-            "Bool_t" or "bool"
+        if (
+            self._members["fType"] == 11
+            and self._members["fTypeName"] in _tstreamerelement_bool_typenames
         ):
             self._members["fType"] = 18
 
@@ -721,7 +810,7 @@ class Model_TStreamerBase(Model_TStreamerElement):
         read_members.append(
             "        self._bases.append(c({0}, {1}).read(chunk, cursor, "
             "context, file, self._file, self._parent, concrete=self.concrete))".format(
-                repr(self.name), repr(self.base_version)
+                self._name_repr, repr(self.base_version)
             )
         )
         read_member_n.append("    " + read_members[-1])
@@ -729,13 +818,13 @@ class Model_TStreamerBase(Model_TStreamerElement):
         strided_interpretation.append(
             "        members.extend(file.class_named({0}, {1})."
             "strided_interpretation(file, header, tobject_header, breadcrumbs).members)".format(
-                repr(self.name), repr(self.base_version)
+                self._name_repr, repr(self.base_version)
             )
         )
         awkward_form.append(
             "        contents.update(file.class_named({0}, {1}).awkward_form(file, "
             "index_format, header, tobject_header, breadcrumbs).contents)".format(
-                repr(self.name), repr(self.base_version)
+                self._name_repr, repr(self.base_version)
             )
         )
 
@@ -836,7 +925,7 @@ class Model_TStreamerBasicPointer(Model_TStreamerElement):
 
         read_members.append(
             "        self._members[{0}] = cursor.array(chunk, self.member({1}), "
-            "tmp, context)".format(repr(self.name), repr(self.count_name))
+            "tmp, context)".format(self._name_repr, repr(self.count_name))
         )
         read_member_n.append("    " + read_members[-1])
 
@@ -852,7 +941,7 @@ class Model_TStreamerBasicPointer(Model_TStreamerElement):
             [
                 "        contents[{0}] = ListOffsetForm(index_format, "
                 "uproot._util.awkward_form(cls._dtype{1}, file, index_format, header, "
-                "tobject_header, breadcrumbs),".format(repr(self.name), len(dtypes)),
+                "tobject_header, breadcrumbs),".format(self._name_repr, len(dtypes)),
                 "            parameters={'uproot': {'as': 'TStreamerBasicPointer', "
                 "'count_name': " + repr(self.count_name) + "}}",
                 "        )",
@@ -860,7 +949,7 @@ class Model_TStreamerBasicPointer(Model_TStreamerElement):
         )
 
         member_names.append(self.name)
-        dtypes.append(_ftype_to_dtype(self.fType - uproot.const.kOffsetP))
+        dtypes.append(_ftype_to_dtype(self.fType - _kOffsetP))
 
     def read_members(self, chunk, cursor, context, file):
         start = cursor.index
@@ -885,6 +974,15 @@ class Model_TStreamerBasicPointer(Model_TStreamerElement):
         self._serialization = _copy_bytes(chunk, start, cursor.index, cursor, context)
 
 
+def _in_struct_run(element):
+    # consecutive scalar basic types are read together with one struct.Struct
+    return (
+        isinstance(element, Model_TStreamerBasicType)
+        and element.array_length == 0
+        and element.typename not in ("Double32_t", "Float16_t")
+    )
+
+
 class Model_TStreamerBasicType(Model_TStreamerElement):
     """
     A versionless :doc:`uproot.model.Model` for ``TStreamerBasicType``.
@@ -914,27 +1012,26 @@ class Model_TStreamerBasicType(Model_TStreamerElement):
     ):
         read_member_n.append("        if member_index == {0}:".format(i))
 
-        if self.typename == "Double32_t":
+        typename = self.typename
+        array_length = self.array_length
+        dtype = _ftype_to_dtype(self.fType)
+
+        if typename == "Double32_t":
             read_members.append(
                 "        self._members[{0}] = cursor.double32(chunk, "
-                "context)".format(repr(self.name))
+                "context)".format(self._name_repr)
             )
             read_member_n.append("    " + read_members[-1])
 
-        elif self.typename == "Float16_t":
+        elif typename == "Float16_t":
             read_members.append(
                 "        self._members[{0}] = cursor.float16(chunk, 12, "
-                "context)".format(repr(self.name))
+                "context)".format(self._name_repr)
             )
             read_member_n.append("    " + read_members[-1])
 
-        elif self.array_length == 0:
-            if (
-                i == 0
-                or not isinstance(elements[i - 1], Model_TStreamerBasicType)
-                or elements[i - 1].array_length != 0
-                or elements[i - 1].typename in ("Double32_t", "Float16_t")
-            ):
+        elif array_length == 0:
+            if i == 0 or not _in_struct_run(elements[i - 1]):
                 fields.append([])
                 formats.append([])
 
@@ -943,11 +1040,7 @@ class Model_TStreamerBasicType(Model_TStreamerElement):
 
             formats_memberwise.append(_ftype_to_struct(self.fType))
 
-            if (
-                i + 1 == len(elements)
-                or not isinstance(elements[i + 1], Model_TStreamerBasicType)
-                or elements[i + 1].array_length != 0
-            ):
+            if i + 1 == len(elements) or not _in_struct_run(elements[i + 1]):
                 if len(fields[-1]) == 1:
                     read_members.append(
                         "        self._members[{0}] = cursor.field(chunk, "
@@ -968,7 +1061,7 @@ class Model_TStreamerBasicType(Model_TStreamerElement):
             read_member_n.append(
                 "            self._members[{0}] = cursor.field(chunk, "
                 "self._format_memberwise{1}, context)".format(
-                    repr(self.name), len(formats_memberwise) - 1
+                    self._name_repr, len(formats_memberwise) - 1
                 )
             )
 
@@ -976,40 +1069,38 @@ class Model_TStreamerBasicType(Model_TStreamerElement):
             read_members.append(
                 "        self._members[{0}] = cursor.array(chunk, {1}, "
                 "self._dtype{2}, context)".format(
-                    repr(self.name), self.array_length, len(dtypes)
+                    self._name_repr, array_length, len(dtypes)
                 )
             )
-            dtypes.append(_ftype_to_dtype(self.fType))
+            dtypes.append(dtype)
 
             read_member_n.append("    " + read_members[-1])
 
-        if self.array_length == 0 and self.typename not in ("Double32_t", "Float16_t"):
+        if array_length == 0 and typename not in ("Double32_t", "Float16_t"):
             strided_interpretation.append(
-                "        members.append(({0}, {1}))".format(
-                    repr(self.name), _ftype_to_dtype(self.fType)
-                )
+                "        members.append(({0}, {1}))".format(self._name_repr, dtype)
             )
         else:
             strided_interpretation.append(
                 "        raise uproot.interpretation.objects.CannotBeStrided("
                 "'class members defined by {0} of type {1} in member "
                 "{2} of class {3}')".format(
-                    type(self).__name__, self.typename, self.name, streamerinfo.name
+                    type(self).__name__, typename, self.name, streamerinfo.name
                 )
             )
 
-        if self.array_length == 0:
-            if self.typename == "Double32_t":
+        if array_length == 0:
+            if typename == "Double32_t":
                 awkward_form.append(
                     "        contents["
-                    + repr(self.name)
+                    + self._name_repr
                     + "] = NumpyForm((), 8, 'd', parameters={'uproot': {'as': 'Double32'}})"
                 )
 
-            elif self.typename == "Float16_t":
+            elif typename == "Float16_t":
                 awkward_form.append(
                     "        contents["
-                    + repr(self.name)
+                    + self._name_repr
                     + "] = NumpyForm((), 4, 'f', parameters={'uproot': {'as': 'Float16'}})"
                 )
 
@@ -1017,7 +1108,7 @@ class Model_TStreamerBasicType(Model_TStreamerElement):
                 awkward_form.append(
                     "        contents[{0}] = uproot._util.awkward_form({1}, "
                     "file, index_format, header, tobject_header, breadcrumbs)".format(
-                        repr(self.name), _ftype_to_dtype(self.fType)
+                        self._name_repr, dtype
                     )
                 )
 
@@ -1025,7 +1116,7 @@ class Model_TStreamerBasicType(Model_TStreamerElement):
             awkward_form.append(
                 "        contents[{0}] = RegularForm(uproot._util.awkward_form({1}, "
                 "file, index_format, header, tobject_header, breadcrumbs), {2})".format(
-                    repr(self.name), _ftype_to_dtype(self.fType), self.array_length
+                    self._name_repr, dtype, array_length
                 )
             )
 
@@ -1045,68 +1136,17 @@ class Model_TStreamerBasicType(Model_TStreamerElement):
                 concrete=self.concrete,
             )
         )
-        if (
-            uproot.const.kOffsetL
-            < self._bases[0]._members["fType"]
-            < uproot.const.kOffsetP
-        ):
-            self._bases[0]._members["fType"] -= uproot.const.kOffsetL
-
-        basic = True
-
-        if self._bases[0]._members["fType"] in (
-            uproot.const.kBool,
-            uproot.const.kUChar,
-            uproot.const.kChar,
-        ):
-            self._bases[0]._members["fSize"] = 1
-
-        elif self._bases[0]._members["fType"] in (
-            uproot.const.kUShort,
-            uproot.const.kShort,
-        ):
-            self._bases[0]._members["fSize"] = 2
-
-        elif self._bases[0]._members["fType"] in (
-            uproot.const.kBits,
-            uproot.const.kUInt,
-            uproot.const.kInt,
-            uproot.const.kCounter,
-        ):
-            self._bases[0]._members["fSize"] = 4
-
-        elif self._bases[0]._members["fType"] in (
-            uproot.const.kULong,
-            uproot.const.kLong,
-        ):
-            self._bases[0]._members["fSize"] = numpy.dtype(numpy.compat.long).itemsize
-
-        elif self._bases[0]._members["fType"] in (
-            uproot.const.kULong64,
-            uproot.const.kLong64,
-        ):
-            self._bases[0]._members["fSize"] = 8
-
-        elif self._bases[0]._members["fType"] in (
-            uproot.const.kFloat,
-            uproot.const.kFloat16,
-        ):
-            self._bases[0]._members["fSize"] = 4
-
-        elif self._bases[0]._members["fType"] in (
-            uproot.const.kDouble,
-            uproot.const.kDouble32,
-        ):
-            self._bases[0]._members["fSize"] = 8
-
-        elif self._bases[0]._members["fType"] == uproot.const.kCharStar:
-            self._bases[0]._members["fSize"] = numpy.dtype(numpy.intp).itemsize
-
-        else:
-            basic = False
-
-        if basic and self._bases[0]._members["fArrayLength"] > 0:
-            self._bases[0]._members["fSize"] *= self._bases[0]._members["fArrayLength"]
+        members = self._bases[0]._members
+        fType = members["fType"]
+        if _kOffsetL < fType < _kOffsetP:
+            fType -= _kOffsetL
+            members["fType"] = fType
+
+        size = _ftype_sizes.get(fType)
+        if size is not None:
+            if members["fArrayLength"] > 0:
+                size *= members["fArrayLength"]
+            members["fSize"] = size
 
         self._serialization = _copy_bytes(chunk, start, cursor.index, cursor, context)
 
@@ -1156,7 +1196,7 @@ class Model_TStreamerLoop(Model_TStreamerElement):
                 ),
                 "            self._members[{0}] = c({1}).read(chunk, cursor, "
                 "context, file, self._file, self.concrete)".format(
-                    repr(self.name), repr(self.typename.rstrip("*"))
+                    self._name_repr, self._typename_stripped_repr
                 ),
             ]
         )
@@ -1173,10 +1213,10 @@ class Model_TStreamerLoop(Model_TStreamerElement):
             [
                 "        tmp = file.class_named({0}, 'max').awkward_form(file, "
                 "index_format, header, tobject_header, breadcrumbs)".format(
-                    repr(self.typename.rstrip("*"))
+                    self._typename_stripped_repr
                 ),
                 "        contents["
-                + repr(self.name)
+                + self._name_repr
                 + "] = ListOffsetForm(index_format, "
                 "tmp, parameters={'uproot': {'as': TStreamerLoop, 'count_name': "
                 + repr(self.count_name)
@@ -1209,7 +1249,7 @@ class Model_TStreamerLoop(Model_TStreamerElement):
         self._serialization = _copy_bytes(chunk, start, cursor.index, cursor, context)
 
     def _dependencies(self, streamers, out):
-        streamer_versions = streamers.get(self.typename.rstrip("*"))
+        streamer_versions = streamers.get(self._typename_stripped)
         if streamer_versions is not None:
             for streamer in streamer_versions.values():
                 if (streamer.name, streamer.class_version) not in out:
@@ -1217,6 +1257,22 @@ class Model_TStreamerLoop(Model_TStreamerElement):
 
 
 _tstreamerstl_format1 = struct.Struct(">ii")
+_stl_container_code_cache = {}
+
+
+def _stl_container_code(typename):
+    # the quoted form of parse_typename is a pure function of the typename
+    out = _stl_container_code_cache.get(typename)
+    if out is None:
+        out = uproot.interpretation.identify.parse_typename(
+            typename,
+            quote=True,
+            outer_header=True,
+            inner_header=False,
+            string_header=True,
+        )
+        _stl_container_code_cache[typename] = out
+    return out
 
 
 class Model_TStreamerSTL(Model_TStreamerElement):
@@ -1262,32 +1318,31 @@ class Model_TStreamerSTL(Model_TStreamerElement):
     ):
         read_member_n.append("        if member_index == {0}:".format(i))
 
-        stl_container = uproot.interpretation.identify.parse_typename(
-            self.typename,
-            quote=True,
-            outer_header=True,
-            inner_header=False,
-            string_header=True,
-        )
+        stl_container = _stl_container_code(self.typename)
+        stl_container_name = "_stl_container" + str(len(containers))
         read_members.append(
-            "        self._members[{0}] = self._stl_container{1}.read("
-            "chunk, cursor, context, file, self._file, self.concrete)"
-            "".format(repr(self.name), len(containers))
+            "        self._members["
+            + self._name_repr
+            + "] = self."
+            + stl_container_name
+            + ".read(chunk, cursor, context, file, self._file, self.concrete)"
         )
         read_member_n.append("    " + read_members[-1])
 
         strided_interpretation.append(
-            "        members.append(({0}, cls._stl_container{1}."
-            "strided_interpretation(file, header, tobject_header, breadcrumbs)))".format(
-                repr(self.name), len(containers)
-            )
+            "        members.append(("
+            + self._name_repr
+            + ", cls."
+            + stl_container_name
+            + ".strided_interpretation(file, header, tobject_header, breadcrumbs)))"
         )
 
         awkward_form.append(
-            "        contents[{0}] = cls._stl_container{1}.awkward_form(file, "
-            "index_format, header, tobject_header, breadcrumbs)".format(
-                repr(self.name), len(containers)
-            )
+            "        contents["
+            + self._name_repr
+            + "] = cls."
+            + stl_container_name
+            + ".awkward_form(file, index_format, header, tobject_header, breadcrumbs)"
         )
 
         containers.append(stl_container)
@@ -1307,23 +1362,18 @@ class Model_TStreamerSTL(Model_TStreamerElement):
                 concrete=self.concrete,
             )
         )
-        self._members["fSTLtype"], self._members["fCtype"] = cursor.fields(
-            chunk, _tstreamerstl_format1, context
-        )
+        stl_type, ctype = cursor.fields(chunk, _tstreamerstl_format1, context)
 
-        if self._members["fSTLtype"] in (
-            uproot.const.kSTLmultimap,
-            uproot.const.kSTLset,
-        ):
-            if self._bases[0]._members["fTypeName"].startswith(
-                "std::set"
-            ) or self._bases[0]._members["fTypeName"].startswith("set"):
-                self._members["fSTLtype"] = uproot.const.kSTLset
+        if stl_type == _kSTLmultimap or stl_type == _kSTLset:
+            typename = self._bases[0]._members["fTypeName"]
+            if typename.startswith(("std::set", "set")):
+                stl_type = _kSTLset
 
-            elif self._bases[0]._members["fTypeName"].startswith(
-                "std::multimap"
-            ) or self._bases[0]._members["fTypeName"].startswith("multimap"):
-                self._members["fSTLtype"] = uproot.const.kSTLmultimap
+            elif typename.startswith(("std::multimap", "multimap")):
+                stl_type = _kSTLmultimap
+
+        self._members["fSTLtype"] = stl_type
+        self._members["fCtype"] = ctype
 
         self._serialization = _copy_bytes(chunk, start, cursor.index, cursor, context)
 
@@ -1355,7 +1405,118 @@ class Model_TStreamerSTLstring(Model_TStreamerSTL):
         self._serialization = _copy_bytes(chunk, start, cursor.index, cursor, context)
 
 
-class TStreamerPointerTypes(object):
+def _pointer_types_objectp(
+    element,
+    streamerinfo,
+    read_members,
+    read_member_n,
+    strided_interpretation,
+    awkward_form,
+    class_flags,
+):
+    read_members.append(
+        "        self._members["
+        + element._name_repr
+        + "] = c("
+        + element._typename_stripped_repr
+        + ").read(chunk, cursor, context, file, self._file, self.concrete)"
+    )
+    read_member_n.append("    " + read_members[-1])
+    strided_interpretation.append(
+        "        members.append(("
+        + element._name_repr
+        + ", file.class_named("
+        + element._typename_stripped_repr
+        + ", 'max').strided_interpretation(file, header, tobject_header, breadcrumbs)))"
+    )
+    awkward_form.append(
+        "        contents["
+        + element._name_repr
+        + "] = file.class_named("
+        + element._typename_stripped_repr
+        + ", 'max').awkward_form(file, index_format, header, tobject_header, breadcrumbs)"
+    )
+
+
+def _pointer_types_objectP(
+    element,
+    streamerinfo,
+    read_members,
+    read_member_n,
+    strided_interpretation,
+    awkward_form,
+    class_flags,
+):
+    read_members.append(
+        "        self._members["
+        + element._name_repr
+        + "] = read_object_any(chunk, cursor, context, file, self._file, self)"
+    )
+    read_member_n.append("    " + read_members[-1])
+    strided_interpretation.append(
+        "        raise uproot.interpretation.objects.CannotBeStrided("
+        "'class members defined by {0} of type {1} in member "
+        "{2} of class {3}')".format(
+            type(element).__name__, element.typename, element.name, streamerinfo.name
+        )
+    )
+    class_flags["has_read_object_any"] = True
+
+
+def _pointer_types_unknown(
+    element,
+    streamerinfo,
+    read_members,
+    read_member_n,
+    strided_interpretation,
+    awkward_form,
+    class_flags,
+):
+    read_members.append(
+        "        raise uproot.deserialization.DeserializationError("
+        "'not implemented: class members defined by {0} with fType {1}', "
+        "chunk, cursor, context, file.file_path)".format(
+            type(element).__name__,
+            element.fType,
+        )
+    )
+    read_member_n.append("    " + read_members[-1])
+
+
+_pointer_types_emitters = {
+    _kObjectp: _pointer_types_objectp,
+    _kAnyp: _pointer_types_objectp,
+    _kObjectP: _pointer_types_objectP,
+    _kAnyP: _pointer_types_objectP,
+}
+
+
+class TStreamerElementOnly(object):
+    """
+    A class to share ``read_members`` between the ``TStreamerElement``
+    subclasses that serialize nothing beyond their
+    :doc:`uproot.streamers.Model_TStreamerElement` base.
+    """
+
+    def read_members(self, chunk, cursor, context, file):
+        start = cursor.index
+
+        self._bases.append(
+            Model_TStreamerElement.read(
+                chunk,
+                cursor,
+                context,
+                file,
+                self._file,
+                self._parent,
+                concrete=self.concrete,
+            )
+        )
+
+        self._serialization = _copy_bytes(chunk, start, cursor.index, cursor, context)
+
+
+class TStreamerPointerTypes(TStreamerElementOnly):
     """
     A class to share code between
     :doc:`uproot.streamers.Model_TStreamerObjectAnyPointer` and
@@ -1382,57 +1543,21 @@ class TStreamerPointerTypes(object):
     ):
         read_member_n.append("        if member_index == {0}:".format(i))
 
-        if self.fType == uproot.const.kObjectp or self.fType == uproot.const.kAnyp:
-            read_members.append(
-                "        self._members[{0}] = c({1}).read(chunk, cursor, context, "
-                "file, self._file, self.concrete)".format(
-                    repr(self.name), repr(self.typename.rstrip("*"))
-                )
-            )
-            read_member_n.append("    " + read_members[-1])
-            strided_interpretation.append(
-                "        members.append(({0}, file.class_named({1}, 'max')."
-                "strided_interpretation(file, header, tobject_header, breadcrumbs)))".format(
-                    repr(self.name), repr(self.typename.rstrip("*"))
-                )
-            )
-            awkward_form.append(
-                "        contents[{0}] = file.class_named({1}, 'max').awkward_form(file, "
-                "index_format, header, tobject_header, breadcrumbs)".format(
-                    repr(self.name), repr(self.typename.rstrip("*"))
-                )
-            )
-
-        elif self.fType == uproot.const.kObjectP or self.fType == uproot.const.kAnyP:
-            read_members.append(
-                "        self._members[{0}] = read_object_any(chunk, cursor, "
-                "context, file, self._file, self)".format(repr(self.name))
-            )
-            read_member_n.append("    " + read_members[-1])
-            strided_interpretation.append(
-                "        raise uproot.interpretation.objects.CannotBeStrided("
-                "'class members defined by {0} of type {1} in member "
-                "{2} of class {3}')".format(
-                    type(self).__name__, self.typename, self.name, streamerinfo.name
-                )
-            )
-            class_flags["has_read_object_any"] = True
-
-        else:
-            read_members.append(
-                "        raise uproot.deserialization.DeserializationError("
-                "'not implemented: class members defined by {0} with fType {1}', "
-                "chunk, cursor, context, file.file_path)".format(
-                    type(self).__name__,
-                    self.fType,
-                )
-            )
-            read_member_n.append("    " + read_members[-1])
+        emitter = _pointer_types_emitters.get(self.fType, _pointer_types_unknown)
+        emitter(
+            self,
+            streamerinfo,
+            read_members,
+            read_member_n,
+            strided_interpretation,
+            awkward_form,
+            class_flags,
+        )
 
         member_names.append(self.name)
 
     def _dependencies(self, streamers, out):
-        streamer_versions = streamers.get(self.typename.rstrip("*"))
+        streamer_versions = streamers.get(self._typename_stripped)
         if streamer_versions is not None:
             for streamer in streamer_versions.values():
                 if (streamer.name, streamer.class_version) not in out:
@@ -1448,23 +1573,6 @@ class Model_TStreamerObjectAnyPointer(TStreamerPointerTypes, Model_TStreamerElem
     instead of creating a behavior class to mix in functionality.
     """
 
-    def read_members(self, chunk, cursor, context, file):
-        start = cursor.index
-
-        self._bases.append(
-            Model_TStreamerElement.read(
-                chunk,
-                cursor,
-                context,
-                file,
-                self._file,
-                self._parent,
-                concrete=self.concrete,
-            )
-        )
-
-        self._serialization = _copy_bytes(chunk, start, cursor.index, cursor, context)
-
 
 class Model_TStreamerObjectPointer(TStreamerPointerTypes, Model_TStreamerElement):
     """
@@ -1475,25 +1583,36 @@ class Model_TStreamerObjectPointer(TStreamerPointerTypes, Model_TStreamerElement
     instead of creating a behavior class to mix in functionality.
     """
 
-    def read_members(self, chunk, cursor, context, file):
-        start = cursor.index
 
-        self._bases.append(
-            Model_TStreamerElement.read(
-                chunk,
-                cursor,
-                context,
-                file,
-                self._file,
-                self._parent,
-                concrete=self.concrete,
-            )
-        )
+_object_types_code_cache = {}
 
-        self._serialization = _copy_bytes(chunk, start, cursor.index, cursor, context)
+
+def _object_types_code(name_repr, typename_repr):
+    # the same member of the same class appears in every file that stores it
+    key = (name_repr, typename_repr)
+    out = _object_types_code_cache.get(key)
+    if out is None:
+        read_line = (
+            "        self._members[{0}] = c({1}).read(chunk, cursor, context, "
+            "file, self._file, self.concrete)".format(name_repr, typename_repr)
+        )
+        out = (
+            read_line,
+            "    " + read_line,
+            "        members.append(({0}, file.class_named({1}, 'max')."
+            "strided_interpretation(file, header, tobject_header, breadcrumbs)))".format(
+                name_repr, typename_repr
+            ),
+            "        contents[{0}] = file.class_named({1}, 'max').awkward_form(file, "
+            "index_format, header, tobject_header, breadcrumbs)".format(
+                name_repr, typename_repr
+            ),
+        )
+        _object_types_code_cache[key] = out
+    return out
 
 
-class TStreamerObjectTypes(object):
+class TStreamerObjectTypes(TStreamerElementOnly):
     """
     A class to share code between
     :doc:`uproot.streamers.Model_TStreamerObject`,
@@ -1521,31 +1640,18 @@ class TStreamerObjectTypes(object):
     ):
         read_member_n.append("        if member_index == {0}:".format(i))
 
-        read_members.append(
-            "        self._members[{0}] = c({1}).read(chunk, cursor, context, "
-            "file, self._file, self.concrete)".format(
-                repr(self.name), repr(self.typename.rstrip("*"))
-            )
-        )
-        read_member_n.append("    " + read_members[-1])
-
-        strided_interpretation.append(
-            "        members.append(({0}, file.class_named({1}, 'max')."
-            "strided_interpretation(file, header, tobject_header, breadcrumbs)))".format(
-                repr(self.name), repr(self.typename.rstrip("*"))
-            )
-        )
-        awkward_form.append(
-            "        contents[{0}] = file.class_named({1}, 'max').awkward_form(file, "
-            "index_format, header, tobject_header, breadcrumbs)".format(
-                repr(self.name), repr(self.typename.rstrip("*"))
-            )
+        read_line, read_n_line, strided_line, awkward_line = _object_types_code(
+            self._name_repr, self._typename_stripped_repr
         )
+        read_members.append(read_line)
+        read_member_n.append(read_n_line)
+        strided_interpretation.append(strided_line)
+        awkward_form.append(awkward_line)
 
         member_names.append(self.name)
 
     def _dependencies(self, streamers, out):
-        streamer_versions = streamers.get(self.typename.rstrip("*"))
+        streamer_versions = streamers.get(self._typename_stripped)
         if streamer_versions is not None:
             for streamer in streamer_versions.values():
                 if (streamer.name, streamer.class_version) not in out:
@@ -1561,23 +1667,6 @@ class Model_TStreamerObject(TStreamerObjectTypes, Model_TStreamerElement):
     instead of creating a behavior class to mix in functionality.
     """
 
-    def read_members(self, chunk, cursor, context, file):
-        start = cursor.index
-
-        self._bases.append(
-            Model_TStreamerElement.read(
-                chunk,
-                cursor,
-                context,
-                file,
-                self._file,
-                self._parent,
-                concrete=self.concrete,
-            )
-        )
-
-        self._serialization = _copy_bytes(chunk, start, cursor.index, cursor, context)
-
 
 class Model_TStreamerObjectAny(TStreamerObjectTypes, Model_TStreamerElement):
     """
@@ -1588,23 +1677,6 @@ class Model_TStreamerObjectAny(TStreamerObjectTypes, Model_TStreamerElement):
     instead of creating a behavior class to mix in functionality.
     """
 
-    def read_members(self, chunk, cursor, context, file):
-        start = cursor.index
-
-        self._bases.append(
-            Model_TStreamerElement.read(
-                chunk,
-                cursor,
-                context,
-                file,
-                self._file,
-                self._parent,
-                concrete=self.concrete,
-            )
-        )
-
-        self._serialization = _copy_bytes(chunk, start, cursor.index, cursor, context)
-
 
 class Model_TStreamerString(TStreamerObjectTypes, Model_TStreamerElement):
     """
@@ -1615,35 +1687,22 @@ class Model_TStreamerString(TStreamerObjectTypes, Model_TStreamerElement):
     instead of creating a behavior class to mix in functionality.
     """
 
-    def read_members(self, chunk, cursor, context, file):
-        start = cursor.index
-
-        self._bases.append(
-            Model_TStreamerElement.read(
-                chunk,
-                cursor,
-                context,
-                file,
-                self._file,
-                self._parent,
-                concrete=self.concrete,
-            )
-        )
-
-        self._serialization = _copy_bytes(chunk, start, cursor.index, cursor, context)
-
 
-uproot.classes["TStreamerInfo"] = Model_TStreamerInfo
-uproot.classes["TStreamerElement"] = Model_TStreamerElement
-uproot.classes["TStreamerArtificial"] = Model_TStreamerArtificial
-uproot.classes["TStreamerBase"] = Model_TStreamerBase
-uproot.classes["TStreamerBasicPointer"] = Model_TStreamerBasicPointer
-uproot.classes["TStreamerBasicType"] = Model_TStreamerBasicType
-uproot.classes["TStreamerLoop"] = Model_TStreamerLoop
-uproot.classes["TStreamerObject"] = Model_TStreamerObject
-uproot.classes["TStreamerObjectAny"] = Model_TStreamerObjectAny
-uproot.classes["TStreamerObjectAnyPointer"] = Model_TStreamerObjectAnyPointer
-uproot.classes["TStreamerObjectPointer"] = Model_TStreamerObjectPointer
-uproot.classes["TStreamerSTL"] = Model_TStreamerSTL
-uproot.classes["TStreamerSTLstring"] = Model_TStreamerSTLstring
-uproot.classes["TStreamerString"] = Model_TStreamerString
+uproot.classes.update(
+    {
+        "TStreamerInfo": Model_TStreamerInfo,
+        "TStreamerElement": Model_TStreamerElement,
+        "TStreamerArtificial": Model_TStreamerArtificial,
+        "TStreamerBase": Model_TStreamerBase,
+        "TStreamerBasicPointer": Model_TStreamerBasicPointer,
+        "TStreamerBasicType": Model_TStreamerBasicType,
+        "TStreamerLoop": Model_TStreamerLoop,
+        "TStreamerObject": Model_TStreamerObject,
+        "TStreamerObjectAny": Model_TStreamerObjectAny,
+        "TStreamerObjectAnyPointer": Model_TStreamerObjectAnyPointer,
+        "TStreamerObjectPointer": Model_TStreamerObjectPointer,
+        "TStreamerSTL": Model_TStreamerSTL,
+        "TStreamerSTLstring": Model_TStreamerSTLstring,
+        "TStreamerString": Model_TStreamerString,
+    }
+)
@@ -0,0 +1,15 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot4/blob/main/LICENSE
+
+import skhep_testdata
+
+import uproot
+
+
+def test_old_bool_type():
+    with uproot.open(skhep_testdata.data_path("uproot-from-geant4.root")) as f:
+        streamer = f.file.streamer_named("TLeaf")
+        for element in streamer.elements:
+            if element.name in ("fIsRange", "fIsUnsigned"):
+                assert element.typename == "bool"
+                assert element.fType == uproot.const.kBool
+                assert element.member("fSize") == 1
@@ -0,0 +1,14 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot4/blob/main/LICENSE
+
+import skhep_testdata
+
+import uproot
+
+
+def test_every_member_is_read():
+    with uproot.open(skhep_testdata.data_path("uproot-issue187.root")) as f:
+        for classname in ("Lifetimes::HyperTriton2Body", "Lifetimes::MiniV0"):
+            cls = f.file.class_named(classname, "max")
+            read_members = cls.class_code.split("    def read_member_n")[0]
+            for name in cls.member_names:
+                assert "self._members[{0}]".format(repr(name)) in read_members